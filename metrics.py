@@ -4,183 +4,325 @@ Analyzes semantic similarity between LLM answers and expected answers
 using multiple metrics and creates visualizations with Seaborn.
 """
 
+import io
 import json
+import os
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; figures are only saved to disk
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from difflib import SequenceMatcher
 import re
 from collections import Counter
+from functools import lru_cache
+
+try:
+    import re2 as _regex  # google-re2: linear-time DFA matching
+except ImportError:
+    _regex = re
+
+try:
+    from rapidfuzz.distance import Indel  # native edit-distance kernels
+except ImportError:
+    Indel = None
+
+# The two backends score on different scales (2*LCS/T vs Ratcliff-Obershelp),
+# so the report records which one produced the numbers
+SEQUENCE_SIM_BACKEND = 'rapidfuzz Indel' if Indel is not None else 'difflib SequenceMatcher'
+
+try:
+    import orjson  # Rust-backed JSON parser
+except ImportError:
+    orjson = None
 
 # Set style for better-looking plots
 sns.set_style("whitegrid")
 sns.set_palette("husl")
 plt.rcParams['figure.figsize'] = (14, 10)
 
+# Precompiled patterns shared by the metric helpers. Tokenizing stays on `re`:
+# RE2's \w, \d and \b are ASCII-only, so "café" would tokenize as "caf" and the
+# keyword/number sets would depend on whether re2 is installed
+_WORD_RE = re.compile(r'\b\w+\b')
+_NUM_RE = re.compile(r'\d+')
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'should', 'could', 'may', 'might', 'must', 'can', 'all',
+})
+
+# Technical terms, matched with RE2 when available; these are ASCII identifiers,
+# so only an API path containing non-ASCII letters can differ between backends.
+# Status codes and API paths can overlap other terms (the "404" or "GET" inside
+# "/api/orders/GET/404"), so they keep their own passes; the word-level name
+# patterns never overlap each other and share one alternation
+_TECH_RES = (
+    _regex.compile(r'\b\d{3}\b'),  # HTTP status codes
+    _regex.compile(
+        r'\b[A-Z][a-zA-Z]*(?:Error|Exception)\b'  # Error / Exception class names
+        r'|\b(?:GET|POST|PUT|DELETE|PATCH)\b'  # HTTP methods
+    ),
+    _regex.compile(r'/api/[\w/-]+'),  # API endpoints
+)
+
+# Composite score weights, in the order the metric axis of the score array uses
+_METRIC_WEIGHTS = {
+    'keyword_overlap': 0.30,
+    'sequence_similarity': 0.20,
+    'length_ratio': 0.10,
+    'number_accuracy': 0.20,
+    'technical_term_match': 0.20
+}
+_WEIGHT_VECTOR = np.array(list(_METRIC_WEIGHTS.values()))
+_METRIC_INDEX = {name: k for k, name in enumerate(_METRIC_WEIGHTS)}
+
+_COMPONENTS = ('root_cause', 'impact', 'suggested_action')
+# Opt-in: above this many characters the difflib sequence-similarity path falls back
+# to trigram Jaccard, which scores lower than ratio(); None always uses SequenceMatcher
+_SEQUENCE_SIM_MAX_LEN = None
+
+_SCORE_COLUMNS = ['root_cause_score', 'impact_score', 'action_score', 'overall_score']
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(text_lower: str) -> Tuple[frozenset, frozenset]:
+    """Scan lowercased text once and return its (keywords, numbers) sets."""
+    words = _WORD_RE.findall(text_lower)
+    keywords = frozenset(w for w in words if len(w) > 2 and w not in _STOP_WORDS)
+    # Digit runs never cross word boundaries, so scanning the tokens is equivalent
+    numbers = frozenset(n for w in words if not w.isalpha() for n in _NUM_RE.findall(w))
+    return keywords, numbers
+
+
+def _jaccard_from_sets(expected: frozenset, actual: frozenset) -> float:
+    """Jaccard similarity of two keyword sets (0.0 when nothing is expected)."""
+    if not expected:
+        return 0.0
+    
+    union = expected | actual
+    return len(expected & actual) / len(union) if union else 0.0
+
+
+def _num_acc_from_sets(expected: frozenset, actual: frozenset) -> float:
+    """Fraction of expected numbers present in the actual set."""
+    if not expected:
+        return 1.0  # No numbers to match
+    
+    return len(expected & actual) / len(expected)
+
+
+def _trigram_jaccard(expected: str, actual: str) -> float:
+    """Jaccard similarity of character trigram sets; a linear-time stand-in for long strings."""
+    exp_grams = {expected[i:i + 3] for i in range(len(expected) - 2)}
+    act_grams = {actual[i:i + 3] for i in range(len(actual) - 2)}
+    union = exp_grams | act_grams
+    return len(exp_grams & act_grams) / len(union) if union else 0.0
+
+
+def _sequence_similarity(exp_lower: str, act_lower: str) -> float:
+    """Sequence similarity of two already-lowercased strings."""
+    if Indel is not None:
+        return Indel.normalized_similarity(exp_lower, act_lower)
+    # SequenceMatcher is quadratic; optionally approximate it for long answers. Trigram
+    # Jaccard runs lower than ratio() on the same text, so scores drop at the threshold
+    if (_SEQUENCE_SIM_MAX_LEN is not None
+            and max(len(exp_lower), len(act_lower)) > _SEQUENCE_SIM_MAX_LEN):
+        return _trigram_jaccard(exp_lower, act_lower)
+    # autojunk's popular-character heuristic skews the ratio on strings of 200+ chars
+    return SequenceMatcher(None, exp_lower, act_lower, autojunk=False).ratio()
+
+
+def _length_ratio(expected: str, actual: str) -> float:
+    """How close the lengths are (1.0 = same length)."""
+    exp_len = len(expected)
+    act_len = len(actual)
+    
+    if exp_len == 0:
+        return 0.0
+    
+    return min(exp_len, act_len) / max(exp_len, act_len)
+
+
+def _technical_term_match(expected: str, actual: str) -> float:
+    """Fraction of expected technical terms (error names, HTTP codes, ...) found in actual."""
+    exp_terms = {term for rx in _TECH_RES for term in rx.findall(expected)}
+    act_terms = {term for rx in _TECH_RES for term in rx.findall(actual)}
+    
+    if not exp_terms:
+        return 1.0
+    
+    return len(exp_terms & act_terms) / len(exp_terms)
+
 
 class LLMEvaluator:
     """Evaluates LLM answers against expected answers using multiple metrics."""
     
     def __init__(self, json_file_path: str):
         """Initialize evaluator with test results JSON file."""
-        with open(json_file_path, 'r') as f:
-            self.data = json.load(f)
+        with open(json_file_path, 'rb') as f:
+            self.data = orjson.loads(f.read()) if orjson is not None else json.load(f)
         self.results = self.data['results']
+        # Cases the collector had in flight at once; above 1, response times include
+        # queueing on the shared LLM backend (older result files were sequential)
+        self.max_concurrency = self.data.get('metadata', {}).get('max_concurrency', 1)
         self.evaluation_df = None
         
-    def extract_keywords(self, text: str) -> set:
-        """Extract meaningful keywords from text."""
-        # Remove common words and extract important terms
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                      'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-                      'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-                      'would', 'should', 'could', 'may', 'might', 'must', 'can', 'all'}
-        
-        # Convert to lowercase and split
-        words = re.findall(r'\b\w+\b', text.lower())
-        return set(word for word in words if word not in stop_words and len(word) > 2)
+    def extract_keywords(self, text: str) -> frozenset:
+        """Extract meaningful keywords from text (memoized per string)."""
+        return _tokenize(text.lower())[0]
     
-    def calculate_keyword_overlap(self, expected: str, actual: str) -> float:
-        """Calculate keyword overlap score (Jaccard similarity)."""
-        expected_keywords = self.extract_keywords(expected)
-        actual_keywords = self.extract_keywords(actual)
-        
-        if not expected_keywords:
-            return 0.0
-            
-        intersection = expected_keywords & actual_keywords
-        union = expected_keywords | actual_keywords
-        
-        return len(intersection) / len(union) if union else 0.0
+    def extract_numbers(self, text: str) -> frozenset:
+        """Extract numeric tokens from text (memoized per string)."""
+        return _tokenize(text.lower())[1]
     
-    def calculate_sequence_similarity(self, expected: str, actual: str) -> float:
-        """Calculate sequence similarity using SequenceMatcher."""
-        return SequenceMatcher(None, expected.lower(), actual.lower()).ratio()
+    def calculate_keyword_overlap(self, expected: str, actual: str, *,
+                                  keywords: Optional[Tuple[frozenset, frozenset]] = None) -> float:
+        """Calculate keyword overlap score (Jaccard similarity).
+        
+        keywords: precomputed (expected, actual) keyword sets, if already extracted.
+        """
+        if keywords is None:
+            keywords = (self.extract_keywords(expected), self.extract_keywords(actual))
+        return _jaccard_from_sets(*keywords)
+    
+    def calculate_sequence_similarity(self, expected: str, actual: str, *,
+                                      lowered: Optional[Tuple[str, str]] = None) -> float:
+        """Calculate sequence similarity (rapidfuzz Indel ratio, difflib fallback).
+        
+        The backends disagree by up to ~0.2 per component; see SEQUENCE_SIM_BACKEND.
+        lowered: the (expected, actual) strings already lowercased, if available.
+        """
+        if lowered is None:
+            lowered = (expected.lower(), actual.lower())
+        return _sequence_similarity(*lowered)
     
     def calculate_length_ratio(self, expected: str, actual: str) -> float:
         """Calculate how close the lengths are (1.0 = same length)."""
-        exp_len = len(expected)
-        act_len = len(actual)
-        
-        if exp_len == 0:
-            return 0.0
-            
-        ratio = min(exp_len, act_len) / max(exp_len, act_len)
-        return ratio
+        return _length_ratio(expected, actual)
     
-    def calculate_number_accuracy(self, expected: str, actual: str) -> float:
-        """Check if numerical values match."""
-        exp_numbers = set(re.findall(r'\d+', expected))
-        act_numbers = set(re.findall(r'\d+', actual))
-        
-        if not exp_numbers:
-            return 1.0  # No numbers to match
-            
-        matches = exp_numbers & act_numbers
-        return len(matches) / len(exp_numbers)
+    def calculate_number_accuracy(self, expected: str, actual: str, *,
+                                  numbers: Optional[Tuple[frozenset, frozenset]] = None) -> float:
+        """Check if numerical values match.
+        
+        numbers: precomputed (expected, actual) number sets, if already extracted.
+        """
+        if numbers is None:
+            numbers = (self.extract_numbers(expected), self.extract_numbers(actual))
+        return _num_acc_from_sets(*numbers)
     
     def calculate_technical_term_match(self, expected: str, actual: str) -> float:
         """Match technical terms (error names, HTTP codes, etc.)."""
-        # Technical patterns
-        patterns = [
-            r'\b\d{3}\b',  # HTTP status codes
-            r'\b[A-Z][a-zA-Z]*Error\b',  # Error class names
-            r'\b[A-Z][a-zA-Z]*Exception\b',  # Exception names
-            r'\b(?:GET|POST|PUT|DELETE|PATCH)\b',  # HTTP methods
-            r'/api/[\w/-]+',  # API endpoints
-        ]
-        
-        exp_terms = set()
-        act_terms = set()
-        
-        for pattern in patterns:
-            exp_terms.update(re.findall(pattern, expected))
-            act_terms.update(re.findall(pattern, actual))
-        
-        if not exp_terms:
-            return 1.0
-            
-        matches = exp_terms & act_terms
-        return len(matches) / len(exp_terms)
+        return _technical_term_match(expected, actual)
     
     def evaluate_answer_component(self, expected: str, actual: str) -> Dict[str, float]:
         """Evaluate a single component (root_cause, impact, or action) with multiple metrics."""
+        # Lowercase and tokenize each string once and share the result across metrics;
+        # only the technical-term match needs the original casing. Overridden metric
+        # methods are called with the plain (expected, actual) signature
+        lowered = (expected.lower(), actual.lower())
+        seq_kwargs = {'lowered': lowered} if self._is_base('calculate_sequence_similarity') else {}
+        keyword_kwargs, number_kwargs = {}, {}
+        if self._is_base('extract_keywords') and self._is_base('extract_numbers'):
+            (exp_keywords, exp_numbers), (act_keywords, act_numbers) = map(_tokenize, lowered)
+            if self._is_base('calculate_keyword_overlap'):
+                keyword_kwargs['keywords'] = (exp_keywords, act_keywords)
+            if self._is_base('calculate_number_accuracy'):
+                number_kwargs['numbers'] = (exp_numbers, act_numbers)
+        
         return {
-            'keyword_overlap': self.calculate_keyword_overlap(expected, actual),
-            'sequence_similarity': self.calculate_sequence_similarity(expected, actual),
+            'keyword_overlap': self.calculate_keyword_overlap(expected, actual, **keyword_kwargs),
+            'sequence_similarity': self.calculate_sequence_similarity(expected, actual, **seq_kwargs),
             'length_ratio': self.calculate_length_ratio(expected, actual),
-            'number_accuracy': self.calculate_number_accuracy(expected, actual),
+            'number_accuracy': self.calculate_number_accuracy(expected, actual, **number_kwargs),
             'technical_term_match': self.calculate_technical_term_match(expected, actual)
         }
     
+    def _is_base(self, name: str) -> bool:
+        """Whether the named method is LLMEvaluator's own rather than a subclass override."""
+        return getattr(type(self), name) is getattr(LLMEvaluator, name)
+    
     def calculate_composite_score(self, metrics: Dict[str, float]) -> float:
         """Calculate weighted composite score from individual metrics."""
-        weights = {
-            'keyword_overlap': 0.30,
-            'sequence_similarity': 0.20,
-            'length_ratio': 0.10,
-            'number_accuracy': 0.20,
-            'technical_term_match': 0.20
-        }
-        
-        return sum(metrics[key] * weights[key] for key in weights)
+        return sum(metrics[key] * weight for key, weight in _METRIC_WEIGHTS.items())
     
     def evaluate_all_tests(self) -> pd.DataFrame:
         """Evaluate all test results and return DataFrame."""
-        evaluation_data = []
+        n_tests = len(self.results)
+        test_names = [result['test_name'] for result in self.results]
+        response_time = np.empty(n_tests, dtype=np.float64)
+        # (tests, components, metrics) array; composites are computed in one pass below
+        metrics_arr = np.empty((n_tests, len(_COMPONENTS), len(_METRIC_WEIGHTS)), dtype=np.float64)
+        
+        per_test_metrics = [
+            [self.evaluate_answer_component(result['expected_answer'][c], result['llm_answer'][c])
+             for c in _COMPONENTS]
+            for result in self.results
+        ]
         
-        for result in self.results:
-            test_name = result['test_name']
-            expected = result['expected_answer']
-            actual = result['llm_answer']
+        for i, (result, component_metrics) in enumerate(zip(self.results, per_test_metrics)):
+            response_time[i] = result['response_time_seconds']
+            for j, metrics in enumerate(component_metrics):
+                metrics_arr[i, j] = [metrics[key] for key in _METRIC_WEIGHTS]
+        
+        if self._is_base('calculate_composite_score'):
+            # Calculate composite scores for every test and component at once
+            composites = metrics_arr @ _WEIGHT_VECTOR
+        else:
+            # Honour an overridden weighting
+            composites = np.array([
+                [self.calculate_composite_score(metrics) for metrics in component_metrics]
+                for component_metrics in per_test_metrics
+            ], dtype=np.float64).reshape(n_tests, len(_COMPONENTS))
+        
+        keyword_overlap = metrics_arr[:, :, _METRIC_INDEX['keyword_overlap']]
+        sequence_sim = metrics_arr[:, :, _METRIC_INDEX['sequence_similarity']]
+        technical_match = metrics_arr[:, :, _METRIC_INDEX['technical_term_match']]
+        
+        self.evaluation_df = pd.DataFrame({
+            'test_name': test_names,
+            'root_cause_score': composites[:, 0],
+            'impact_score': composites[:, 1],
+            'action_score': composites[:, 2],
+            'overall_score': composites.mean(axis=1),
+            'response_time': response_time,
             
-            # Evaluate each component
-            root_cause_metrics = self.evaluate_answer_component(
-                expected['root_cause'], actual['root_cause']
-            )
-            impact_metrics = self.evaluate_answer_component(
-                expected['impact'], actual['impact']
-            )
-            action_metrics = self.evaluate_answer_component(
-                expected['suggested_action'], actual['suggested_action']
-            )
+            # Individual metrics for root cause
+            'rc_keyword_overlap': keyword_overlap[:, 0],
+            'rc_sequence_sim': sequence_sim[:, 0],
+            'rc_technical_match': technical_match[:, 0],
             
-            # Calculate composite scores
-            root_cause_score = self.calculate_composite_score(root_cause_metrics)
-            impact_score = self.calculate_composite_score(impact_metrics)
-            action_score = self.calculate_composite_score(action_metrics)
-            overall_score = (root_cause_score + impact_score + action_score) / 3
+            # Individual metrics for impact
+            'imp_keyword_overlap': keyword_overlap[:, 1],
+            'imp_sequence_sim': sequence_sim[:, 1],
+            'imp_technical_match': technical_match[:, 1],
             
-            evaluation_data.append({
-                'test_name': test_name,
-                'root_cause_score': root_cause_score,
-                'impact_score': impact_score,
-                'action_score': action_score,
-                'overall_score': overall_score,
-                'response_time': result['response_time_seconds'],
-                
-                # Individual metrics for root cause
-                'rc_keyword_overlap': root_cause_metrics['keyword_overlap'],
-                'rc_sequence_sim': root_cause_metrics['sequence_similarity'],
-                'rc_technical_match': root_cause_metrics['technical_term_match'],
-                
-                # Individual metrics for impact
-                'imp_keyword_overlap': impact_metrics['keyword_overlap'],
-                'imp_sequence_sim': impact_metrics['sequence_similarity'],
-                'imp_technical_match': impact_metrics['technical_term_match'],
-                
-                # Individual metrics for action
-                'act_keyword_overlap': action_metrics['keyword_overlap'],
-                'act_sequence_sim': action_metrics['sequence_similarity'],
-                'act_technical_match': action_metrics['technical_term_match'],
-            })
-        
-        self.evaluation_df = pd.DataFrame(evaluation_data)
+            # Individual metrics for action
+            'act_keyword_overlap': keyword_overlap[:, 2],
+            'act_sequence_sim': sequence_sim[:, 2],
+            'act_technical_match': technical_match[:, 2],
+        }, copy=False)
         return self.evaluation_df
     
-    def create_visualizations(self, output_dir: str = './metrics-assements'):
+    def _sequence_sim_backend_label(self) -> str:
+        """SEQUENCE_SIM_BACKEND, noting how many components used the trigram fallback."""
+        if Indel is not None or _SEQUENCE_SIM_MAX_LEN is None:
+            return SEQUENCE_SIM_BACKEND
+        n_long = sum(
+            max(len(result['expected_answer'][c].lower()),
+                len(result['llm_answer'][c].lower())) > _SEQUENCE_SIM_MAX_LEN
+            for result in self.results for c in _COMPONENTS
+        )
+        if not n_long:
+            return SEQUENCE_SIM_BACKEND
+        return (f"{SEQUENCE_SIM_BACKEND} (trigram Jaccard for {n_long} components "
+                f"over {_SEQUENCE_SIM_MAX_LEN} chars)")
+    
+    def create_visualizations(self, output_dir: str = './metrics-assements', dpi: int = 150):
         """Create comprehensive visualizations of the evaluation results."""
         # Create output directory if it doesn't exist
         import os
@@ -189,12 +331,15 @@ class LLMEvaluator:
         if self.evaluation_df is None:
             self.evaluate_all_tests()
         
+        # Column means of the current frame, reused by several panels
+        means = self.evaluation_df.mean(numeric_only=True)
+        
         # Create figure with subplots
         fig = plt.figure(figsize=(18, 12))
         
         # 1. Overall Scores by Component (Grouped Bar Chart)
         ax1 = plt.subplot(2, 3, 1)
-        score_data = self.evaluation_df[['root_cause_score', 'impact_score', 'action_score']].mean()
+        score_data = means[['root_cause_score', 'impact_score', 'action_score']]
         colors = sns.color_palette("husl", 3)
         bars = ax1.bar(range(len(score_data)), score_data, color=colors, alpha=0.8, edgecolor='black')
         ax1.set_xticks(range(len(score_data)))
@@ -218,7 +363,7 @@ class LLMEvaluator:
         score_matrix.columns = [f"T{i+1}" for i in range(len(self.evaluation_df))]
         sns.heatmap(score_matrix, annot=True, fmt='.2f', cmap='RdYlGn', 
                     vmin=0, vmax=1, cbar_kws={'label': 'Score'}, ax=ax2,
-                    linewidths=0.5, linecolor='gray')
+                    linewidths=0.5, linecolor='gray', rasterized=True)
         ax2.set_ylabel('Component', fontsize=11, fontweight='bold')
         ax2.set_xlabel('Test Number', fontsize=11, fontweight='bold')
         ax2.set_title('Score Heatmap Across Tests', fontsize=12, fontweight='bold')
@@ -252,9 +397,9 @@ class LLMEvaluator:
         }
         metric_labels = ['Keyword\nOverlap', 'Sequence\nSimilarity', 'Technical\nMatch']
         
-        rc_metrics = [self.evaluation_df[f'rc_{m}'].mean() for m in metric_map.values()]
-        imp_metrics = [self.evaluation_df[f'imp_{m}'].mean() for m in metric_map.values()]
-        act_metrics = [self.evaluation_df[f'act_{m}'].mean() for m in metric_map.values()]
+        rc_metrics = means[[f'rc_{m}' for m in metric_map.values()]].values
+        imp_metrics = means[[f'imp_{m}' for m in metric_map.values()]].values
+        act_metrics = means[[f'act_{m}' for m in metric_map.values()]].values
         
         x = np.arange(len(metric_labels))
         width = 0.25
@@ -277,10 +422,13 @@ class LLMEvaluator:
                              self.evaluation_df['overall_score'],
                              c=self.evaluation_df['overall_score'], 
                              cmap='RdYlGn', s=150, alpha=0.7,
-                             edgecolors='black', linewidth=1.5)
+                             edgecolors='black', linewidth=1.5, rasterized=True)
         ax5.set_xlabel('Response Time (seconds)', fontsize=11, fontweight='bold')
         ax5.set_ylabel('Overall Score', fontsize=11, fontweight='bold')
-        ax5.set_title('Response Time vs Quality', fontsize=12, fontweight='bold')
+        title = 'Response Time vs Quality'
+        if self.max_concurrency > 1:
+            title += f'\n(includes queueing, {self.max_concurrency} concurrent)'
+        ax5.set_title(title, fontsize=12, fontweight='bold')
         ax5.grid(alpha=0.3)
         
         # Add correlation coefficient
@@ -296,32 +444,13 @@ class LLMEvaluator:
         ax6.axis('tight')
         ax6.axis('off')
         
+        stats = self.evaluation_df[_SCORE_COLUMNS].agg(['std', 'min', 'max'])
         summary_stats = pd.DataFrame({
             'Metric': ['Root Cause', 'Impact', 'Action', 'Overall'],
-            'Mean': [
-                self.evaluation_df['root_cause_score'].mean(),
-                self.evaluation_df['impact_score'].mean(),
-                self.evaluation_df['action_score'].mean(),
-                self.evaluation_df['overall_score'].mean()
-            ],
-            'Std Dev': [
-                self.evaluation_df['root_cause_score'].std(),
-                self.evaluation_df['impact_score'].std(),
-                self.evaluation_df['action_score'].std(),
-                self.evaluation_df['overall_score'].std()
-            ],
-            'Min': [
-                self.evaluation_df['root_cause_score'].min(),
-                self.evaluation_df['impact_score'].min(),
-                self.evaluation_df['action_score'].min(),
-                self.evaluation_df['overall_score'].min()
-            ],
-            'Max': [
-                self.evaluation_df['root_cause_score'].max(),
-                self.evaluation_df['impact_score'].max(),
-                self.evaluation_df['action_score'].max(),
-                self.evaluation_df['overall_score'].max()
-            ]
+            'Mean': means[_SCORE_COLUMNS].values,
+            'Std Dev': stats.loc['std'].values,
+            'Min': stats.loc['min'].values,
+            'Max': stats.loc['max'].values
         })
         
         # Format values for display
@@ -357,29 +486,32 @@ class LLMEvaluator:
         ax6.set_title('Summary Statistics', fontsize=12, fontweight='bold', pad=20)
         
         plt.tight_layout()
-        plt.savefig(f'{output_dir}/llm_evaluation_dashboard.png', dpi=300, bbox_inches='tight')
+        plt.savefig(f'{output_dir}/llm_evaluation_dashboard.png', dpi=dpi, bbox_inches='tight')
         print(f"Dashboard saved to {output_dir}/llm_evaluation_dashboard.png")
         
         # Create detailed breakdown chart
-        self._create_detailed_breakdown(output_dir)
+        self._create_detailed_breakdown(output_dir, dpi)
         
         return fig
     
-    def _create_detailed_breakdown(self, output_dir: str):
+    def _create_detailed_breakdown(self, output_dir: str, dpi: int = 150):
         """Create detailed breakdown of individual test performance."""
         fig, axes = plt.subplots(2, 5, figsize=(20, 8))
         axes = axes.flatten()
         
+        # Shared across every test's subplot
+        categories = ['Root\nCause', 'Impact', 'Action']
+        colors = sns.color_palette("husl", 3)
+        bar_kwargs = dict(alpha=0.7, edgecolor='black')
+        
         for idx, (i, row) in enumerate(self.evaluation_df.iterrows()):
             ax = axes[idx]
             
             # Create spider/radar chart for each test
-            categories = ['Root\nCause', 'Impact', 'Action']
             scores = [row['root_cause_score'], row['impact_score'], row['action_score']]
             
             # Create bar chart for each test
-            colors = sns.color_palette("husl", 3)
-            bars = ax.bar(categories, scores, color=colors, alpha=0.7, edgecolor='black')
+            bars = ax.bar(categories, scores, color=colors, **bar_kwargs)
             ax.set_ylim(0, 1)
             ax.set_title(f"Test {idx+1}\n{row['test_name'][:30]}...", fontsize=9, fontweight='bold')
             ax.axhline(y=0.8, color='green', linestyle='--', alpha=0.3)
@@ -395,7 +527,7 @@ class LLMEvaluator:
                        f'{score:.2f}', ha='center', va='bottom', fontsize=7)
         
         plt.tight_layout()
-        plt.savefig(f'{output_dir}/llm_evaluation_detailed.png', dpi=300, bbox_inches='tight')
+        plt.savefig(f'{output_dir}/llm_evaluation_detailed.png', dpi=dpi, bbox_inches='tight')
         print(f"Detailed breakdown saved to {output_dir}/llm_evaluation_detailed.png")
     
     def generate_report(self, output_dir: str = './metrics-assements') -> str:
@@ -407,21 +539,33 @@ class LLMEvaluator:
         if self.evaluation_df is None:
             self.evaluate_all_tests()
         
-        report = []
-        report.append("=" * 80)
-        report.append("LLM ANSWER QUALITY EVALUATION REPORT")
-        report.append("=" * 80)
-        report.append("")
+        # Column means of the current frame, reused across sections
+        means = self.evaluation_df.mean(numeric_only=True)
+        
+        buffer = io.StringIO()
+        
+        def emit(line: str = "") -> None:
+            print(line, file=buffer)
+        
+        emit("=" * 80)
+        emit("LLM ANSWER QUALITY EVALUATION REPORT")
+        emit("=" * 80)
+        emit(f"Sequence similarity backend: {self._sequence_sim_backend_label()}")
+        emit()
         
         # Overall Statistics
-        report.append("OVERALL PERFORMANCE")
-        report.append("-" * 80)
-        report.append(f"Average Overall Score: {self.evaluation_df['overall_score'].mean():.3f}")
-        report.append(f"Average Root Cause Score: {self.evaluation_df['root_cause_score'].mean():.3f}")
-        report.append(f"Average Impact Score: {self.evaluation_df['impact_score'].mean():.3f}")
-        report.append(f"Average Action Score: {self.evaluation_df['action_score'].mean():.3f}")
-        report.append(f"Average Response Time: {self.evaluation_df['response_time'].mean():.2f} seconds")
-        report.append("")
+        emit("OVERALL PERFORMANCE")
+        emit("-" * 80)
+        emit(f"Average Overall Score: {means['overall_score']:.3f}")
+        emit(f"Average Root Cause Score: {means['root_cause_score']:.3f}")
+        emit(f"Average Impact Score: {means['impact_score']:.3f}")
+        emit(f"Average Action Score: {means['action_score']:.3f}")
+        if self.max_concurrency > 1:
+            emit(f"Average Response Time: {means['response_time']:.2f} seconds "
+                 f"(includes queueing, {self.max_concurrency} concurrent)")
+        else:
+            emit(f"Average Response Time: {means['response_time']:.2f} seconds")
+        emit()
         
         # Performance Categories
         excellent = self.evaluation_df[self.evaluation_df['overall_score'] >= 0.85]
@@ -431,57 +575,60 @@ class LLMEvaluator:
                                          (self.evaluation_df['overall_score'] < 0.70)]
         needs_improvement = self.evaluation_df[self.evaluation_df['overall_score'] < 0.60]
         
-        report.append("PERFORMANCE DISTRIBUTION")
-        report.append("-" * 80)
-        report.append(f"Excellent (≥0.85): {len(excellent)} tests ({len(excellent)/len(self.evaluation_df)*100:.1f}%)")
-        report.append(f"Good (0.70-0.84): {len(good)} tests ({len(good)/len(self.evaluation_df)*100:.1f}%)")
-        report.append(f"Acceptable (0.60-0.69): {len(acceptable)} tests ({len(acceptable)/len(self.evaluation_df)*100:.1f}%)")
-        report.append(f"Needs Improvement (<0.60): {len(needs_improvement)} tests ({len(needs_improvement)/len(self.evaluation_df)*100:.1f}%)")
-        report.append("")
+        emit("PERFORMANCE DISTRIBUTION")
+        emit("-" * 80)
+        emit(f"Excellent (≥0.85): {len(excellent)} tests ({len(excellent)/len(self.evaluation_df)*100:.1f}%)")
+        emit(f"Good (0.70-0.84): {len(good)} tests ({len(good)/len(self.evaluation_df)*100:.1f}%)")
+        emit(f"Acceptable (0.60-0.69): {len(acceptable)} tests ({len(acceptable)/len(self.evaluation_df)*100:.1f}%)")
+        emit(f"Needs Improvement (<0.60): {len(needs_improvement)} tests ({len(needs_improvement)/len(self.evaluation_df)*100:.1f}%)")
+        emit()
         
         # Best and Worst Performing Tests
-        report.append("TOP 3 PERFORMING TESTS")
-        report.append("-" * 80)
+        emit("TOP 3 PERFORMING TESTS")
+        emit("-" * 80)
         top_tests = self.evaluation_df.nlargest(3, 'overall_score')
         for idx, row in top_tests.iterrows():
-            report.append(f"{row['test_name']}: {row['overall_score']:.3f}")
-            report.append(f"  - Root Cause: {row['root_cause_score']:.3f}, Impact: {row['impact_score']:.3f}, Action: {row['action_score']:.3f}")
-        report.append("")
+            emit(f"{row['test_name']}: {row['overall_score']:.3f}")
+            emit(f"  - Root Cause: {row['root_cause_score']:.3f}, Impact: {row['impact_score']:.3f}, Action: {row['action_score']:.3f}")
+        emit()
         
-        report.append("BOTTOM 3 PERFORMING TESTS")
-        report.append("-" * 80)
+        emit("BOTTOM 3 PERFORMING TESTS")
+        emit("-" * 80)
         bottom_tests = self.evaluation_df.nsmallest(3, 'overall_score')
         for idx, row in bottom_tests.iterrows():
-            report.append(f"{row['test_name']}: {row['overall_score']:.3f}")
-            report.append(f"  - Root Cause: {row['root_cause_score']:.3f}, Impact: {row['impact_score']:.3f}, Action: {row['action_score']:.3f}")
-        report.append("")
+            emit(f"{row['test_name']}: {row['overall_score']:.3f}")
+            emit(f"  - Root Cause: {row['root_cause_score']:.3f}, Impact: {row['impact_score']:.3f}, Action: {row['action_score']:.3f}")
+        emit()
         
         # Insights
-        report.append("KEY INSIGHTS")
-        report.append("-" * 80)
+        emit("KEY INSIGHTS")
+        emit("-" * 80)
         
         # Which component performs best/worst
         comp_scores = {
-            'Root Cause': self.evaluation_df['root_cause_score'].mean(),
-            'Impact': self.evaluation_df['impact_score'].mean(),
-            'Action': self.evaluation_df['action_score'].mean()
+            'Root Cause': means['root_cause_score'],
+            'Impact': means['impact_score'],
+            'Action': means['action_score']
         }
         best_comp = max(comp_scores, key=comp_scores.get)
         worst_comp = min(comp_scores, key=comp_scores.get)
         
-        report.append(f"• Strongest Component: {best_comp} ({comp_scores[best_comp]:.3f})")
-        report.append(f"• Weakest Component: {worst_comp} ({comp_scores[worst_comp]:.3f})")
+        emit(f"• Strongest Component: {best_comp} ({comp_scores[best_comp]:.3f})")
+        emit(f"• Weakest Component: {worst_comp} ({comp_scores[worst_comp]:.3f})")
         
-        # Response time correlation
-        corr = self.evaluation_df['response_time'].corr(self.evaluation_df['overall_score'])
-        if abs(corr) < 0.3:
-            corr_interp = "weak"
-        elif abs(corr) < 0.7:
-            corr_interp = "moderate"
+        # Response time correlation; concurrent timings mostly reflect queue position
+        if self.max_concurrency > 1:
+            emit(f"• Response Time Correlation: n/a ({self.max_concurrency} concurrent requests)")
         else:
-            corr_interp = "strong"
-        
-        report.append(f"• Response Time Correlation: {corr:.3f} ({corr_interp})")
+            corr = self.evaluation_df['response_time'].corr(self.evaluation_df['overall_score'])
+            if abs(corr) < 0.3:
+                corr_interp = "weak"
+            elif abs(corr) < 0.7:
+                corr_interp = "moderate"
+            else:
+                corr_interp = "strong"
+            
+            emit(f"• Response Time Correlation: {corr:.3f} ({corr_interp})")
         
         # Consistency
         std = self.evaluation_df['overall_score'].std()
@@ -492,12 +639,12 @@ class LLMEvaluator:
         else:
             consistency = "variable"
         
-        report.append(f"• Score Consistency: {consistency} (std: {std:.3f})")
-        report.append("")
+        emit(f"• Score Consistency: {consistency} (std: {std:.3f})")
+        emit()
         
-        report.append("=" * 80)
+        emit("=" * 80)
         
-        report_text = "\n".join(report)
+        report_text = buffer.getvalue().rstrip("\n")
         
         # Save report
         with open(f'{output_dir}/evaluation_report.txt', 'w') as f:
@@ -524,6 +671,7 @@ def main():
     print("\n" + "="*80)
     print("EVALUATION RESULTS SUMMARY")
     print("="*80)
+    print(f"Sequence similarity backend: {evaluator._sequence_sim_backend_label()}")
     print(df[['test_name', 'root_cause_score', 'impact_score', 'action_score', 'overall_score']].to_string(index=False))
     
     # Create output directory
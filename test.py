@@ -1,35 +1,116 @@
+import asyncio
+import hashlib
 import json
-import requests
+import httpx
 import time
 from datetime import datetime
 
+try:
+    import orjson  # Rust-backed JSON parser/serializer
+except ImportError:
+    orjson = None
+
 # Configuration
 BASE_URL = "http://localhost:9000"
 TEST_CASES_FILE = "error_span_test_cases.json"
 OUTPUT_FILE = "llm_test_results.json"
+CACHE_FILE = ".llm_test_cache.json"
+
+# Maximum number of test cases in flight at once. The server answers from a single
+# local Ollama model, so above 1 response_time_seconds mostly measures queueing
+# behind other cases (metrics.py labels such runs). Raise it only to collect
+# answers faster when latency does not matter
+MAX_CONCURRENCY = 1
+
+# Per-request timeout in seconds; None waits indefinitely for slow LLM answers
+REQUEST_TIMEOUT = None
 
 # Simple question for all test cases
 QUESTION = "Explain the root cause, impact, and suggested action for this error."
 
 
+def read_json(path):
+    """Read a JSON file, using orjson when available"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def write_json(path, data):
+    """Write indented JSON, using orjson when available"""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
 def load_test_cases():
     """Load test cases from JSON file"""
-    with open(TEST_CASES_FILE, 'r') as f:
-        data = json.load(f)
+    data = read_json(TEST_CASES_FILE)
     return data['test_cases']
 
 
-def register_user():
+def load_cache():
+    """Load the cached user and upload ids from a previous run"""
+    try:
+        return read_json(CACHE_FILE)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache):
+    """Persist the user and upload ids for the next run"""
+    write_json(CACHE_FILE, cache)
+
+
+def trace_hash(trace):
+    """Stable content hash used to key cached upload ids"""
+    if orjson:
+        canonical = orjson.dumps(trace, option=orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps(trace, sort_keys=True, separators=(',', ':'),
+                               ensure_ascii=False).encode()
+    return hashlib.sha256(canonical).hexdigest()
+
+
+async def token_is_valid(client, token):
+    """Probe a protected endpoint; auth runs before body validation, so only a bad token gets 401"""
+    response = await client.post(
+        "/explain-span",
+        headers={"Authorization": f"Bearer {token}"},
+        json={}
+    )
+    return response.status_code != 401
+
+
+async def get_user(client, cache):
+    """Reuse the cached user if the server still accepts its token, else register a new one"""
+    if cache.get('base_url') == BASE_URL and cache.get('token'):
+        if await token_is_valid(client, cache['token']):
+            print(f"✓ Reusing cached user - User ID: {cache['user_id']}")
+            return cache['token'], cache['user_id']
+        print("Cached token rejected by server")
+    
+    token, user_id = await register_user(client)
+    # Uploads belong to the old user, so they are dropped along with it
+    cache.clear()
+    cache.update(base_url=BASE_URL, token=token, user_id=user_id, uploads={})
+    return token, user_id
+
+
+async def register_user(client):
     """Register and get token"""
     print("Registering user...")
-    response = requests.post(f"{BASE_URL}/register")
+    response = await client.post("/register")
     response.raise_for_status()
     data = response.json()
     print(f"✓ Registered - User ID: {data['user_id']}")
     return data['token'], data['user_id']
 
 
-def upload_trace(token, trace):
+async def upload_trace(client, token, trace):
     """Upload trace and get upload_id"""
     headers = {
         "Authorization": f"Bearer {token}",
@@ -37,15 +118,15 @@ def upload_trace(token, trace):
     }
     
     # Send the trace as-is (already in OTLP format)
-    response = requests.post(
-        f"{BASE_URL}/upload-trace",
+    response = await client.post(
+        "/upload-trace",
         headers=headers,
         json=trace
     )
     response.raise_for_status()
     return response.json()['upload_id']
 
-def query_llm(token, upload_id, span_id, question):
+async def query_llm(client, token, upload_id, span_id, question):
     """Query LLM for explanation"""
     headers = {
         "Authorization": f"Bearer {token}",
@@ -58,8 +139,8 @@ def query_llm(token, upload_id, span_id, question):
         "question": question
     }
     
-    response = requests.post(
-        f"{BASE_URL}/explain-span",
+    response = await client.post(
+        "/explain-span",
         headers=headers,
         json=payload
     )
@@ -67,58 +148,44 @@ def query_llm(token, upload_id, span_id, question):
     return response.json()
 
 
-def run_tests():
-    """Main test runner"""
-    print(f"\n{'='*60}")
-    print("Starting LLM Answer Collection")
-    print(f"{'='*60}\n")
-    
-    # Load test cases
-    test_cases = load_test_cases()
-    print(f"Loaded {len(test_cases)} test cases\n")
-    
-    # Register user once
-    token, user_id = register_user()
-    
-    # Results storage
-    results = {
-        "metadata": {
-            "timestamp": datetime.now().isoformat(),
-            "user_id": user_id,
-            "total_tests": len(test_cases),
-            "base_url": BASE_URL
-        },
-        "results": []
+async def process_case(client, token, test_case, sem, label, cache):
+    """Upload one test case's trace and collect the LLM answer"""
+    uploads = cache['uploads']
+    key = trace_hash(test_case['trace'])
+    result = {
+        "test_name": test_case['name'],
+        "span_id": test_case['span_id'],
+        "expected_answer": test_case['expected_answer'],
+        "status": "pending"
     }
     
-    # Process each test case
-    for idx, test_case in enumerate(test_cases, 1):
-        print(f"\n[{idx}/{len(test_cases)}] Processing: {test_case['name']}")
-        
-        result = {
-            "test_name": test_case['name'],
-            "span_id": test_case['span_id'],
-            "expected_answer": test_case['expected_answer'],
-            "status": "pending"
-        }
-        
+    async with sem:
+        print(f"{label} Processing: {test_case['name']}")
         try:
-            # Upload trace
-            print("  → Uploading trace...")
-            upload_id = upload_trace(token, test_case['trace'])
+            # Upload trace unless this exact trace was uploaded on a previous run
+            upload_id = uploads.get(key)
+            from_cache = upload_id is not None
+            if from_cache:
+                print(f"{label}  ✓ Cached upload ID: {upload_id}")
+            else:
+                upload_id = uploads[key] = await upload_trace(client, token, test_case['trace'])
+                print(f"{label}  ✓ Upload ID: {upload_id}")
             result['upload_id'] = upload_id
-            print(f"  ✓ Upload ID: {upload_id}")
             
             # Query LLM (may take time)
-            print(f"  → Querying LLM (this may take a few seconds)...")
             start_time = time.time()
             
-            llm_response = query_llm(
-                token,
-                upload_id,
-                test_case['span_id'],
-                QUESTION
-            )
+            try:
+                llm_response = await query_llm(client, token, upload_id, test_case['span_id'], QUESTION)
+            except httpx.HTTPStatusError as e:
+                if not (from_cache and e.response.status_code == 404):
+                    raise
+                # The server no longer has the cached trace; upload it again and retry once
+                upload_id = uploads[key] = await upload_trace(client, token, test_case['trace'])
+                result['upload_id'] = upload_id
+                print(f"{label}  ✓ Re-uploaded, Upload ID: {upload_id}")
+                start_time = time.time()
+                llm_response = await query_llm(client, token, upload_id, test_case['span_id'], QUESTION)
             
             elapsed = time.time() - start_time
             
@@ -126,29 +193,75 @@ def run_tests():
             result['response_time_seconds'] = round(elapsed, 2)
             result['status'] = "success"
             
-            print(f"  ✓ LLM responded in {elapsed:.2f}s")
-            
-        except requests.exceptions.HTTPError as e:
+            print(f"{label}  ✓ LLM responded in {elapsed:.2f}s")
+        
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                # Token is no longer accepted; force a fresh registration next run
+                cache.pop('token', None)
             result['status'] = "error"
             result['error'] = str(e)
-            result['error_details'] = e.response.text if e.response else None
-            print(f"  ✗ HTTP Error: {e}")
-            
+            result['error_details'] = e.response.text
+            print(f"{label}  ✗ HTTP Error: {e}")
+        
         except Exception as e:
             result['status'] = "error"
             result['error'] = str(e)
-            print(f"  ✗ Error: {e}")
-        
-        results['results'].append(result)
+            print(f"{label}  ✗ Error: {e}")
+    
+    return result
+
+
+async def collect_results(test_cases):
+    """Register once, then process all test cases concurrently"""
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=REQUEST_TIMEOUT) as client:
+        # Register user once (or reuse the one from the previous run)
+        cache = load_cache()
+        token, user_id = await get_user(client, cache)
         
-        # Small delay between requests
-        time.sleep(1)
+        # Bound concurrency so the LLM backend is not flooded (sequential by default)
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        total = len(test_cases)
+        print(f"Querying LLM for {total} test cases (up to {MAX_CONCURRENCY} at a time)...\n")
+        case_results = await asyncio.gather(*[
+            process_case(client, token, test_case, sem, f"[{idx}/{total}]", cache)
+            for idx, test_case in enumerate(test_cases, 1)
+        ])
+    
+    save_cache(cache)
+    
+    return user_id, case_results
+
+
+def run_tests():
+    """Main test runner"""
+    print(f"\n{'='*60}")
+    print("Starting LLM Answer Collection")
+    print(f"{'='*60}\n")
+    
+    # Load test cases
+    test_cases = load_test_cases()
+    print(f"Loaded {len(test_cases)} test cases\n")
+    
+    user_id, case_results = asyncio.run(collect_results(test_cases))
+    
+    # Results storage
+    results = {
+        "metadata": {
+            "timestamp": datetime.now().isoformat(),
+            "user_id": user_id,
+            "total_tests": len(test_cases),
+            "base_url": BASE_URL,
+            # response_time_seconds was measured with this many cases in flight
+            "max_concurrency": MAX_CONCURRENCY
+        },
+        "results": case_results
+    }
     
     # Save results
     print(f"\n{'='*60}")
     print("Saving results...")
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump(results, f, indent=2)
+    write_json(OUTPUT_FILE, results)
     
     # Summary
     success_count = sum(1 for r in results['results'] if r['status'] == 'success')
@@ -170,8 +283,8 @@ if __name__ == "__main__":
     except FileNotFoundError as e:
         print(f"\nError: Could not find {TEST_CASES_FILE}")
         print("Make sure the test cases file is in the same directory")
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print(f"\nError: Could not connect to {BASE_URL}")
         print("Make sure the API server is running")
     except Exception as e:
-        print(f"\nUnexpected error: {e}")
\ No newline at end of file
+        print(f"\nUnexpected error: {e}")